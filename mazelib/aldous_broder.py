@@ -321,22 +321,27 @@ class AldousBroder(object):
         min_cells = min(min_cells, 0.8 * len(maze.unvisited))
 
         n = 0         # number of iterations
-        while maze.unvisited:
+        unvisited, curr = maze.unvisited, maze.curr
+        remaining = len(unvisited)          # kept up to date below
+        while remaining:
             n += 1
 
-            nbr = choice(maze.curr.neighbors)
-            if nbr in maze.unvisited:
-                maze.curr.link(nbr)
-                maze.unvisited.discard(nbr)
-            maze.curr = nbr
+            nbr = choice(curr.neighbors)
+            if nbr in unvisited:
+                curr.link(nbr)
+                unvisited.discard(nbr)
+                remaining -= 1
+            curr = nbr
 
                 # breakpoint?
-            if n >= max_its or len(maze.unvisited)<min_cells:
+            if n >= max_its or remaining < min_cells:
+                maze.curr = curr          # resume from here
                 if debug:
                     print(f'  {n} iterations')
                     print(f'  {len(maze.unvisited)} unvisited')
                 return maze
 
+        maze.curr = curr
         if debug:
             print(f'  {n} iterations')
             print(f'  {len(maze.unvisited)} unvisited')
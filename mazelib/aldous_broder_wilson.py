@@ -41,6 +41,7 @@ LICENSE
 
 from random import choice
 from wilson import Wilson
+from maze_support import IndexedSet
 
 class HybridABW(object):
     """HybridABW - start with Aldous-Broder and finish with Wilson"""
@@ -216,7 +217,7 @@ class HybridABW(object):
 
             # initialization
 
-        unvisited = set(grid.cells)
+        unvisited = IndexedSet(grid.cells)
         curr = start if start else choice(grid.cells)
         unvisited.discard(curr)
         if debug:
@@ -246,8 +247,10 @@ class HybridABW(object):
             print(f'  {len(unvisited)} unvisited')
             print('HybridABW start circuit-erased random walks')
 
+        hoods = {cell: tuple(cell.neighbors) for cell in unvisited}
         while unvisited:
-            path = Wilson.circuit_erased_walk(unvisited, debug=debug)
+            path = Wilson.circuit_erased_walk(unvisited, debug=debug,
+                                              hoods=hoods)
             while len(path) > 1:
                 curr = path.pop(0)
                 step = path[0]
@@ -151,7 +151,7 @@ class DFSBinaryTree(object):
         stack.enter(None, root)
         visited = set([])
 
-        while not stack.isEmpty:
+        while stack:
             parent, cell = stack.serve()
             if cell in visited:
                 continue        # already adopted
@@ -228,7 +228,7 @@ class BFSBinaryTree(object):
         queue.enter(None, root)
         visited = set([])
 
-        while not queue.isEmpty:
+        while queue:
             parent, cell = queue.serve()
             if cell in visited:
                 continue        # already adopted
@@ -35,6 +35,10 @@ LICENSE
         <https://www.gnu.org/licenses/>.
 """
 
+    # maze mutation counter, shared by all cells; a list, so that
+    # counting does not rebind an attribute of the Cell class
+_version = [0]
+
 class Cell(object):
     """Cell - implementation of a simple cell class
 
@@ -188,6 +192,7 @@ class Cell(object):
         """carve a directed link to another cell"""
         if cell:
             self._passages[cell] = weight
+            _version[0] += 1
 
     def link(self, cell, weight=1):
         """carve an undirected link with another cell"""
@@ -202,6 +207,7 @@ class Cell(object):
         """remove a one-way passage"""
         if cell in self._passages:
             del self._passages[cell]
+            _version[0] += 1
 
     def unlink(self, cell):
         """remove any passage with the cell"""
@@ -243,7 +243,7 @@ class WelshPowell(object):
 
                 # now we clear the rest of the heap
                 # coloring if possible
-            while not queue.isEmpty:
+            while queue:
                 cell = queue.serve()[0]
                 ok_to_color = True
                 for nbr in cell.passages:
@@ -43,7 +43,7 @@ MODIFICATIONS
 """
 
 from math import floor
-from cell import Cell, SquareCell
+from cell import Cell, SquareCell, _version
 
 class Grid(object):
     """Grid - implementation of a grid base class"""
@@ -106,6 +106,17 @@ class Grid(object):
         """return a list of facial walls (edges)"""
         return list(self._walls.values())
 
+    @property
+    def version(self):
+        """maze mutation counter
+
+        The counter increases whenever a passage is carved or removed,
+        or a cell is added to or removed from a grid.  It is shared by
+        all cells, so a change in any grid is reported as a change in
+        every grid.
+        """
+        return _version[0]
+
     @property
     def cells(self):
         """return a list of cells"""
@@ -124,8 +135,10 @@ class Grid(object):
         """associate a cell with an index (operator []=)"""
         if cell:
             self._cells[index] = cell
+            _version[0] += 1      # the maze has changed
         elif index in self._cells:
             del self._cells[index]
+            _version[0] += 1
         return cell
 
     def each_index(self):
@@ -430,8 +443,10 @@ class RectangularGrid(Grid):
         """associate a cell will an index, or dissociate it"""
         if cell:
             self._cells[index] = cell
+            _version[0] += 1      # the maze has changed
         elif index in self._cells:
             del self._cells[index]
+            _version[0] += 1
         return cell
 
     def _make_wall(self, i, cells, direction=None,
@@ -465,27 +480,27 @@ class RectangularGrid(Grid):
         left, middle, right = nodes
         passage, entry, exit, wall = walls
 
-        s = ''
+        s = []
         first = True
         for cell in cells:
-            s += left if first else middle
+            s.append(left if first else middle)
             first = False
             nbr = cell[direction]
             if nbr:
                 if cell.isLinkedTo(nbr):
                     if nbr.isLinkedTo(cell):
-                        s += passage  # two-way passage
+                        s.append(passage)  # two-way passage
                     else:
-                        s += exit     # exit-only passage
+                        s.append(exit)     # exit-only passage
                 else:
                     if nbr.isLinkedTo(cell):
-                        s += entry    # entrance-only passage
+                        s.append(entry)    # entrance-only passage
                     else:
-                        s += wall     # internal wall - no passage
+                        s.append(wall)     # internal wall - no passage
             else:
-                s += wall             # external wall
-        s += right
-        return s
+                s.append(wall)             # external wall
+        s.append(right)
+        return ''.join(s)
 
     def _make_faces(self, i, cells, walls=[' ', '>', '<', '|']):
         """helper for __str__ and unicode
@@ -510,7 +525,7 @@ class RectangularGrid(Grid):
         passage, entry, exit, wall = walls
         direction = RectangularGrid.WEST
 
-        s = ''
+        s = []
         first = True
         for cell in cells:
             first = False
@@ -518,17 +533,17 @@ class RectangularGrid(Grid):
             if nbr:
                 if cell.isLinkedTo(nbr):
                     if nbr.isLinkedTo(cell):
-                        s += passage  # two-way passage
+                        s.append(passage)  # two-way passage
                     else:
-                        s += exit     # exit-only passage
+                        s.append(exit)     # exit-only passage
                 else:
                     if nbr.isLinkedTo(cell):
-                        s += entry    # entrance-only passage
+                        s.append(entry)    # entrance-only passage
                     else:
-                        s += wall     # internal wall - no passage
+                        s.append(wall)     # internal wall - no passage
             else:
-                s += wall             # external wall
-            s += ' ' + cell.text[0] + ' ' if cell.text else '   '
+                s.append(wall)             # external wall
+            s.append(' ' + cell.text[0] + ' ' if cell.text else '   ')
 
         cell = cells[-1]
         direction = RectangularGrid.EAST
@@ -537,17 +552,17 @@ class RectangularGrid(Grid):
         if nbr:
             if cell.isLinkedTo(nbr):
                 if nbr.isLinkedTo(cell):
-                    s += passage  # two-way passage
+                    s.append(passage)  # two-way passage
                 else:
-                    s += exit     # exit-only passage
+                    s.append(exit)     # exit-only passage
             else:
                 if nbr.isLinkedTo(cell):
-                    s += entry    # entrance-only passage
+                    s.append(entry)    # entrance-only passage
                 else:
-                    s += wall     # internal wall - no passage
+                    s.append(wall)     # internal wall - no passage
         else:
-            s += wall             # external wall
-        return s
+            s.append(wall)             # external wall
+        return ''.join(s)
 
     def __str__(self):
         """string representation of the maze"""
@@ -287,7 +287,7 @@ class HuntAndKill(object):
         """hunt phase of hunt and kill"""
         fcount = 0                      # for log
         
-        while not state.frontier.isEmpty:
+        while state.frontier:
             prev, curr = state.frontier.serve()
             fcount += 1                 # for log
             if curr in state.unvisited:
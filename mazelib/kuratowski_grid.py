@@ -123,7 +123,7 @@ LICENSE
         <https://www.gnu.org/licenses/>.
 """
 
-from math import pi, sin, cos, asin, acos, atan, sqrt
+from math import pi, sin, cos, asin, acos, atan, hypot
 from cell import Cell
 from grid import Grid
 
@@ -287,7 +287,7 @@ class CompleteGrid(Grid):
 
             # length of line connecting the centers:
             #     d(P,Q) = sqrt(dx^2 + dy^2)
-        ds = sqrt((xi0-xj0)**2 + (yi0-yj0)**2)
+        ds = hypot(xi0-xj0, yi0-yj0)
 
             # coordinates of the intersections with the cell
             # walls...
@@ -499,7 +499,7 @@ class BipartiteGrid(PartiteGrid):
 
             # length of line connecting the centers:
             #     d(P,Q) = sqrt(dx^2 + dy^2)
-        ds = sqrt((xi0-xj0)**2 + (yi0-yj0)**2)
+        ds = hypot(xi0-xj0, yi0-yj0)
 
             # coordinates of the intersections with the cell
             # walls...
@@ -164,7 +164,7 @@ class MaskedCell(Cell):
     def linkto(self, cell, weight=1):
         """carve a directed link to another cell"""
         if cell:
-            self.child._passages[cell.child] = weight
+            self.child.linkto(cell.child, weight)
 
     def isLinkedTo(self, cell):
         """is there a link?"""
@@ -172,8 +172,7 @@ class MaskedCell(Cell):
 
     def unlinkto(self, cell):
         """remove a one-way passage"""
-        if cell.child in self.child._passages:
-            del self.child_passages[cell.child]
+        self.child.unlinkto(cell.child)
 
     @property
     def passages(self):
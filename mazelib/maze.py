@@ -35,6 +35,7 @@ LICENSE
 """
 
 from random import choice
+from collections import deque
 
 class Maze(object):
     """Maze - implementation of a maze base class"""
@@ -60,6 +61,7 @@ class Maze(object):
         self._args = args
         self._kwargs = kwargs
         self.sketcher = None      # sketch interface
+        self._cache = {}          # property : (grid version, value)
 
         self.initialize()
         self.configure()
@@ -89,9 +91,52 @@ class Maze(object):
         kwargs = self._kwargs
         return MazeClass(grid, *args, **kwargs)
 
+    def _cached(self, name, method):
+        """return a cached value, recomputing it if the grid changed"""
+        version = self.grid.version
+        entry = self._cache.get(name)
+        if entry and entry[0] == version:
+            return entry[1]
+        value = method()
+        self._cache[name] = (version, value)
+        return value
+
     @property
     def components(self):
-        """returns the set of components"""
+        """returns the set of components
+
+        The components are cached until the grid changes.  Callers
+        get copies, so the cached sets cannot be modified.
+        """
+        return [set(component) for component \
+            in self._cached('components', self._components)]
+
+    def _is_tree(self):
+        """is the maze a spanning tree?
+
+        A maze with v cells is a tree if and only if it is connected
+        and it has v-1 edges.  The edge count is checked first as it is
+        cached.
+        """
+        cells = self.grid._cells
+        if not cells or self.e != self.v - 1:
+            return False
+        start = next(iter(cells.values()))
+        visited = set([start])
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for nbr in cell.passages:
+                if nbr not in visited:
+                    visited.add(nbr)
+                    queue.append(nbr)
+        return len(visited) == self.v
+
+    def _components(self):
+        """find the components"""
+        if self._is_tree():
+            return [set(self.grid.each_cell())]
+
         bag = {}          # principal cell : component of node
         cells = {}        # cell : principal cell
 
@@ -104,16 +149,17 @@ class Maze(object):
 
             # main loop
             #   We search to find the components
-        stack = list(self.grid.cells)
-        while stack:
-            cell = stack.pop()
+        for cell in self.grid.each_cell():
             label = cells[cell]
             for nbr in cell.passages:
                 owner = cells[nbr]
                 if owner == label:
                     continue
+                    # merge the smaller component into the larger
+                if len(bag[owner]) > len(bag[label]):
+                    label, owner = owner, label
+                bag[label] |= bag[owner]
                 for item in bag[owner]:
-                    bag[label].add(item)
                     cells[item] = label
                 del bag[owner]
 
@@ -131,9 +177,13 @@ class Maze(object):
     @property
     def e(self):
         """number of edges"""
+        return self._cached('e', self._edges)
+
+    def _edges(self):
+        """count the edges"""
         n = 0
-        for cell in grid.each_cell():
-            passages = set(cell.passages)
+        for cell in self.grid.each_cell():
+            passages = cell.passages    # distinct, as they are dict keys
             n += len(passages)
             if cell in passages:
                 n += 1        # loops are counted twice
@@ -155,7 +205,7 @@ class Maze(object):
             # maze, then the result isn't very useful.  But it is
             # what it is!
             #
-        n = n // 2 if n % 2 else n / 2    # return int if possible
+        n = n / 2 if n % 2 else n // 2    # return int if possible
         return n
 
     @property
@@ -172,7 +222,7 @@ class Maze(object):
     @property
     def k(self):
         """number of grid components"""
-        return len(self.components)
+        return len(self._cached('components', self._components))
 
     @property
     def Euler_chi(self):
@@ -31,26 +31,50 @@ LICENSE
         <https://www.gnu.org/licenses/>.
 """
 from math import sqrt, ceil, sin, cos, pi
+from cmath import rect
+from functools import lru_cache
 from PIL import Image, ImageFont, ImageDraw
 
+@lru_cache(maxsize=None)
+def load_font(fontname, fontsize):
+    """load a TrueType font
+
+    If the font cannot be found, the PIL default font is used instead.
+    Fonts are loaded just once.
+    """
+    try:
+        return ImageFont.truetype(fontname + ".ttf", fontsize)
+    except OSError:
+        return ImageFont.load_default()
+
+load_font("arial", 16)          # preload the default font
+
 class MazeSketcher(object):
     """MazeSketcher - control for sketching a maze using PIL"""
 
+    __slots__ = ('maze', 'args', 'kwargs', 'img', 'settings', 'canvas',
+                 '_spare')
+
     def __init__(self, maze, *args, **kwargs):
         """constructor"""
         self.maze = maze
         self.args = args
         self.kwargs = kwargs
         self.img = None
+        self._spare = None        # the image from the last sketch
         self.settings = {}
         maze.sketcher = self
 
     def open(self, width=800, height=600, margins=[20,10,10,10],
-             **gobblekwargs):
+             reuse=False, **gobblekwargs):
         """start a sketch
 
         The margins, in order, are [top, bottom, left, right].
 
+        If reuse is true and the previous sketch had a canvas of the
+        same size, that image is repainted instead of allocating a
+        new one.  (The previous image must no longer be needed.)
+
         Saved in settings:
             width, height, margins
         """
@@ -61,11 +85,19 @@ class MazeSketcher(object):
         top, bottom, left, right = self.settings['margins'] = margins
         canvasHeight = height + top + bottom
         canvasWidth = width + left + right
-        self.img = Image.new("RGB", (canvasWidth, canvasHeight))
+            # the canvas is created with its background color, so
+            # only its outline needs to be drawn
+        size = (canvasWidth, canvasHeight)
+        img = self._spare if reuse else None
+        if img and img.size == size:
+            img.paste("white", (0, 0) + size)
+        else:
+            img = Image.new("RGB", size, "white")
+        self.img = img
 
         self.canvas = img1 = ImageDraw.Draw(self.img)
         shape = [(0, 0), (canvasWidth, canvasHeight)]
-        img1.rectangle(shape, fill="white", outline="yellow")
+        img1.rectangle(shape, outline="yellow")
         shape = [(left, top), (left+width, top+height)]
         img1.rectangle(shape, fill="lightslategray", outline="black")
 
@@ -75,7 +107,7 @@ class MazeSketcher(object):
 
     def entitle(self, text, fontname="arial", fontsize=16):
         """put a title in the top margin"""
-        fontinfo = ImageFont.truetype(fontname + ".ttf", fontsize)
+        fontinfo = load_font(fontname, fontsize)
         self.canvas.text((20,0), text, (0,0,0), font=fontinfo)
 
     def _transform(self, x, y):
@@ -150,9 +182,28 @@ class MazeSketcher(object):
 
         PIL seems to prefer piecharts and ellipses with axes parallel
         to the coordinate axes.  When in Rome...
+
+        An outlined segment is drawn as a single polygon, with the
+        arcs approximated by chords of at most a few pixels.
         """
         (x, y) = center
         assert r1>r2
+
+        if outline and outline != fill:
+            theta1, theta2 = theta1*2*pi, theta2*2*pi
+            n = max(2, ceil(r1 * abs(theta2-theta1) / 3))
+            dtheta = (theta2-theta1) / n
+            cosine, sine = cos, sin     # local names for the loop
+            transform = self._transform
+            polygon = []
+            for r, steps in ((r1, range(n+1)), (r2, range(n, -1, -1))):
+                for i in steps:
+                    theta = theta1 + i*dtheta
+                    polygon.append(transform(x + r * cosine(theta),
+                                             y - r * sine(theta)))
+            self.canvas.polygon(polygon, fill=fill, outline=outline)
+            return
+
         diagonal1 = ((x-r1, y+r1), (x+r1, y-r1))
         diagonal2 = ((x-r2, y+r2), (x+r2, y-r2))
 
@@ -160,58 +211,58 @@ class MazeSketcher(object):
         u11, v11 = self._transform(x11, y11)
         u12, v12 = self._transform(x12, y12)
         xy1 = (u11, v11, u12, v12)                # outer diagonal
-        # self.canvas.arc(xy1, 0, 360, fill="grey", width=4)
 
         (x21, y21), (x22, y22) = diagonal2        # unpack endpoints
         u21, v21 = self._transform(x21, y21)
-        u22, v22 = self._transform(x22, y22)
-        xy2 = (u21, v21, u22, v22)                # inner diagonal
-        # self.canvas.arc(xy2, 0, 360, fill="green", width=4)
 
         width = ceil(max(u21-u11, v21-v11))
+        self.canvas.arc(xy1, theta1*360, theta2*360, fill=fill,
+                        width=width)
 
-        if outline and outline != fill:
-            self.canvas.arc(xy1, theta1*360, theta2*360,
-                            fill=outline, width=2)
-            u11 += 1
-            v11 += 1
-            u12 -= 1
-            v12 -= 1
-            xy1 = (u11, v11, u12, v12)                # outer diagonal
-            self.canvas.arc(xy1, theta1*360, theta2*360,
-                            fill=fill, width=width-1)
-            u11 += width-1
-            v11 += width-1
-            u12 -= width-1
-            v12 -= width-1
-            xy1 = (u11, v11, u12, v12)                # outer diagonal
-            self.canvas.arc(xy1, theta1*360, theta2*360,
-                            fill=outline, width=1)
-
-            x3 = x + r1 * cos(theta1*2*pi)
-            y3 = y - r1 * sin(theta1*2*pi)
-
-            x4 = x + r2 * cos(theta1*2*pi)
-            y4 = y - r2 * sin(theta1*2*pi)
-            self.draw_line_segment((x3,y3), (x4,y4), fill=outline,
-                                   thickness=1)
-
-            x3 = x + r1 * cos(theta2*2*pi)
-            y3 = y - r1 * sin(theta2*2*pi)
-
-            x4 = x + r2 * cos(theta2*2*pi)
-            y4 = y - r2 * sin(theta2*2*pi)
-            self.draw_line_segment((x3,y3), (x4,y4), fill=outline,
-                                   thickness=1)
-        else:
-            self.canvas.arc(xy1, theta1*360, theta2*360, fill=fill,
-                            width=width)
+    def draw_segments(self, center, r1, r2, bounds, fills,
+                      outline=None):
+        """draw a row of annular segments of equal angular width
+
+        bounds - a list of (theta1, theta2) pairs in revolutions, all
+            with the same difference theta2 - theta1
+        fills - the corresponding list of fill colors
+
+        The effect is that of calling draw_segment for each segment.
+        For outlined segments, the chord points are worked out once
+        relative to theta1 and then rotated into place for each
+        segment.
+        """
+        if not bounds:
+            return
+        (x, y) = center
+        assert r1>r2
+
+        theta1, theta2 = bounds[0]
+        sweep = (theta2-theta1)*2*pi
+        n = max(2, ceil(r1 * abs(sweep) / 3))
+        dtheta = sweep / n
+        chords = [rect(r1, i*dtheta) for i in range(n+1)] \
+            + [rect(r2, i*dtheta) for i in range(n, -1, -1)]
+
+            # polygon vertices in image coordinates (see _transform)
+        u0, v0 = self._transform(x, y)
+        for (theta1, theta2), fill in zip(bounds, fills):
+            if not outline or outline == fill:
+                self.draw_segment(center, r1, r2, theta1, theta2,
+                                  fill=fill, outline=outline)
+                continue
+            rotor = rect(1, theta1*2*pi)
+            polygon = []
+            for z in chords:
+                z *= rotor
+                polygon.append((u0 + z.real, v0 + z.imag))
+            self.canvas.polygon(polygon, fill=fill, outline=outline)
 
     def draw_text(self, location, text, fontname="arial", fontsize=16):
         """draw a collection of line segments"""
         x, y = location           # unpack point
         u, v = self._transform(x, y)
-        fontinfo = ImageFont.truetype(fontname + ".ttf", fontsize)
+        fontinfo = load_font(fontname, fontsize)
         self.canvas.text((u,v), text, (0,0,0), font=fontinfo)
 
     def close(self, filename=None, show=True, **gobblekwargs):
@@ -220,6 +271,6 @@ class MazeSketcher(object):
             self.img.save(filename)
         if show:
             self.img.show()
-        self.img = None
+        self._spare, self.img = self.img, None
 
 # end of maze_pillow.py
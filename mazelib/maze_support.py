@@ -11,6 +11,13 @@ DESCRIPTION
             Stack - a LIFO (last in, first out) queuing class
             Heap - a BIFO (best in, first out) priority queue
 
+                other containers
+        IndexedSet - a set with constant-time random selection
+
+                helper functions
+        edge_key - a hashable key for an undirected edge
+        euler_characteristic - the Euler characteristic of a maze
+
 REFERENCES
 
     [1] Jamis Buck.  Mazes for programmers.  2015, the Pragmatic
@@ -34,11 +41,84 @@ LICENSE
 """
 
 from random import random, randrange
+from itertools import count
+from collections import deque
 import heapq
 
+def edge_key(cell1, cell2):
+    """return a key for the undirected edge joining two cells
+
+    The key is the pair of cells in a fixed order, so edge_key(a, b)
+    and edge_key(b, a) are equal.  A pair is much cheaper to build and
+    to hash than frozenset([cell1, cell2]).
+    """
+    return (cell1, cell2) if id(cell1) <= id(cell2) else (cell2, cell1)
+
+def euler_characteristic(maze, output=True):
+    """determine the Euler characteristic of the maze
+
+    Returns v - e - k.  The counts are those of the maze, which caches
+    the edge count and the components until a passage changes.
+
+    BUGS
+
+        Will fail if there are one-way passages.
+    """
+    v = maze.v
+    e = maze.e
+    k = maze.k
+    chi = v - e - k
+    if output:
+        print('Maze characteristic:')
+        print('       number of nodes:', '        v =', v)
+        print('       number of edges:', '        e =', e)
+        print('  number of components:', '        k =', k)
+        print('  Euler characteristic:', 'v - e - k =', chi)
+    return chi
+
+class IndexedSet(dict):
+    """a set with constant-time random selection
+
+    The members are the keys of the dictionary, so membership, length
+    and truth tests are those of a dictionary.  Each key maps to its
+    position in a list of the members, which is used for random
+    selection.  Removal fills the hole with the last member.
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items=()):
+        """constructor"""
+        super().__init__()
+        self._items = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        """add a member"""
+        if item not in self:
+            self[item] = len(self._items)
+            self._items.append(item)
+
+    def discard(self, item):
+        """remove a member if it is present"""
+        i = self.pop(item, None)
+        if i is None:
+            return
+        last = self._items.pop()
+        if i < len(self._items):
+            self._items[i] = last     # last fills the hole
+            self[last] = i
+
+    def choice(self):
+        """return a random member"""
+        return self._items[randrange(len(self._items))]
+
 class Unqueue(object):
     """a generalized queuing class - random in, first out"""
 
+    __slots__ = ('_queue', '_args', '_kwargs')
+
     def __init__(self, *args, **kwargs):
         """constructor"""
         self._queue = []
@@ -69,15 +149,23 @@ class Unqueue(object):
 
     def serve(self):
         """remove a random package from the queue"""
-        i = randrange(len(self._queue))
-        package = self._queue[i]
-        self._queue = self._queue[:i] + self._queue[i+1:]
+        queue = self._queue
+        i = randrange(len(queue))
+            # the order of the queue does not matter, so the last
+            # package fills the hole in constant time
+        package = queue[i]
+        queue[i] = queue[-1]
+        queue.pop()
         return package
 
     def __len__(self):
         """return the number of entries"""
         return len(self._queue)
 
+    def __bool__(self):
+        """true if there are entries"""
+        return bool(self._queue)
+
     @property
     def isEmpty(self):
         """determine whether the queue is empty"""
@@ -86,13 +174,21 @@ class Unqueue(object):
 class Queue(Unqueue):
     """a standard FIFO queue"""
 
+    __slots__ = ()
+
+    def initialize(self):
+        """additional initialization"""
+        self._queue = deque()     # constant time at both ends
+
     def serve(self):
         """remove the first package from the queue"""
-        return self._queue.pop(0)
+        return self._queue.popleft()
 
 class Stack(Unqueue):
     """a standard LIFO stack"""
 
+    __slots__ = ()
+
     def serve(self):
         """remove the last package from the queue"""
         return self._queue.pop()
@@ -100,6 +196,8 @@ class Stack(Unqueue):
 class Heap(Unqueue):
     """a min-priority queue implemented as a heap"""
 
+    __slots__ = ('_a', '_b', '_index')
+
     def initialize(self):
         """additional initialization
 
@@ -114,7 +212,7 @@ class Heap(Unqueue):
         interval = self._kwargs.get('interval', [1,2])
         self._a = interval[0]
         self._b = interval[1]
-        self._index = 0         # order of entry
+        self._index = count()   # order of entry
 
     def enter(self, *args, **kwargs):
         """package the arguments and put them in into the queue
@@ -130,10 +228,12 @@ class Heap(Unqueue):
                 priority is a random value in the interval provided to
                 the constructor
         """
-        a, b = self._a, self._b
-        priority = kwargs.get('priority', (b-a)*random() + a)
-        package = (priority, self._index, args)
-        self._index += 1        # order of entry
+        if 'priority' in kwargs:
+            priority = kwargs['priority']
+        else:
+            a, b = self._a, self._b
+            priority = (b-a)*random() + a
+        package = (priority, next(self._index), args)
         heapq.heappush(self._queue, package)
 
     def serve(self):
@@ -72,13 +72,50 @@ LICENSE
         <https://www.gnu.org/licenses/>.
 """
 
-from math import pi, sin, cos, asin, acos, atan, sqrt
+from math import pi, sin, cos
+from cmath import rect
+from functools import lru_cache
 from cell import Cell
 from grid import Grid
 
+@lru_cache(maxsize=None)
+def petersen_edges(n, k):
+    """the edges of the generalized Petersen graph G(n,k)
+
+    RETURNS
+
+        edges - a tuple of index pairs (index1, index2), one for each
+            edge, in the order n-gon, n-gram, spokes
+        src, dst - tuples of the corresponding cell numbers (i*n + j)
+
+    The edges depend only on n and k, so they are computed just once
+    for each pair and shared by all the grids with those parameters.
+    """
+    edges = []
+    for j in range(n):                  # the outer circuit
+        edges.append(((0, j), (0, (j+1)%n)))
+    for j in range(n):                  # the inner circuit
+        edges.append(((1, j), (1, (j+k)%n)))
+    for j in range(n):                  # connecting the circuits
+        edges.append(((0, j), (1, j)))
+    src = tuple(i*n + j for (i, j), index2 in edges)
+    dst = tuple(i*n + j for index1, (i, j) in edges)
+    return tuple(edges), src, dst
+
 class PetersenGrid(Grid):
     """PetersenGrid - Petersen grid base class"""
 
+    SKETCH_DEFAULTS = {
+        'outer_ring': 120,      # pixel radius of outer ring
+        'inner_ring': 60,       # pixel radius of inner ring
+        'cell_radius': 20,      # pixel radius of a cell
+        'edge_width': pi / 18,  # 10 degrees of arc
+        'hmargin': 50,          # reserved part of window
+        'vmargin': 50,
+        'min_width': 400,
+        'min_height': 300,
+    }
+
     def __init__(self, n, k, *args, **kwargs):
         """constructor"""
             # reduce and validate n and k
@@ -119,46 +156,36 @@ class PetersenGrid(Grid):
         k = self.k
         wallbuilder = self._kwargs.get(self.WALLBUILDER)
 
-            # Step 1: n-gon
-            # construct the outer circuit
-        for j in range(n):
-            index = (0, j)
-            cell = Cell(index)
-            cell.index = index
-            self[index] = cell
-
-        for j in range(n):
-            index1 = (0, j)
-            index2 = (0, (j+1)%n)
-            self[index1][index2] = self[index2]
-            self[index2][index1] = self[index1]
-            if wallbuilder:
-                self[index1].link(self[index2])
-
-            # Step 2: n-gram
-            # construct the inner circuit
-        for j in range(n):
-            index = (1, j)
-            cell = Cell(index)
-            cell.index = index
-            self[index] = cell
-
-        for j in range(n):
-            index1 = (1, j)
-            index2 = (1, (j+k)%n)
-            self[index1][index2] = self[index2]
-            self[index2][index1] = self[index1]
-            if wallbuilder:
-                self[index1].link(self[index2])
-
-            # Step 3: connect the two circuits
-        for j in range(n):
-            index1 = (0, j)
-            index2 = (1, j)
-            self[index1][index2] = self[index2]
-            self[index2][index1] = self[index1]
+            # Step 0: cell placement
+            # the directions of the cells from the center
+        self._cos = tuple(cos(2*pi*j/n) for j in range(n))
+        self._sin = tuple(sin(2*pi*j/n) for j in range(n))
+
+            # Step 1: cells
+            #   row 0 is the outer circuit (the n-gon) and row 1 is
+            #   the inner circuit (the n-gram)
+        for i in range(2):
+            for j in range(n):
+                index = (i, j)
+                cell = Cell(index)
+                cell.index = index
+                self[index] = cell
+
+            # Step 2: edges
+            #   the cell numbers in _edge_src and _edge_dst index the
+            #   list of cell centers
+        self._edges, self._edge_src, self._edge_dst = petersen_edges(n, k)
+        for index1, index2 in self._edges:
+            cell1, cell2 = self[index1], self[index2]
+            cell1[index2] = cell2
+            cell2[index1] = cell1
             if wallbuilder:
-                self[index1].link(self[index2])
+                cell1.link(cell2)
+
+    def _id(self, index):
+        """the cell number of the cell with the given index"""
+        i, j = index
+        return i*self.n + j
 
     def sketch_setup(self):
         """sketch parameter setup
@@ -170,114 +197,98 @@ class PetersenGrid(Grid):
             vertices is large and the maze is highly connected, the
             sketch will be a mess.
         """
-        OUTERRING = 120          # pixel radius of outer ring
-        if not self._kwargs.get('outer_ring'):
-            self._kwargs['outer_ring'] = OUTERRING
+        for key, value in self.SKETCH_DEFAULTS.items():
+            if not self._kwargs.get(key):
+                self._kwargs[key] = value
 
-        INNERRING = 60           # pixel radius of inner ring
-        if not self._kwargs.get('inner_ring'):
-            self._kwargs['inner_ring'] = INNERRING
         assert self._kwargs['outer_ring'] > self._kwargs['inner_ring']
-
-        CELLRADIUS = 20          # pixel radius of a cell
-        if not self._kwargs.get('cell_radius'):
-            self._kwargs['cell_radius'] = CELLRADIUS
         assert self._kwargs['inner_ring'] > self._kwargs['cell_radius']
-
-        EDGEWIDTH = pi / 18      # 10 degrees of arc
-        if not self._kwargs.get('edge_width'):
-            self._kwargs['edge_width'] = EDGEWIDTH
         assert self._kwargs['edge_width'] > 0
-
-        MARGIN = 50              # reserved part of window
-        if not self._kwargs.get('hmargin'):
-            self._kwargs['hmargin'] = MARGIN
         assert self._kwargs['hmargin'] > 0
-        if not self._kwargs.get('vmargin'):
-            self._kwargs['vmargin'] = MARGIN
         assert self._kwargs['vmargin'] > 0
 
-        MINWIDTH = 400
-        if not self._kwargs.get('min_width'):
-            self._kwargs['min_width'] = MINWIDTH
-
-        MINHEIGHT = 300
-        if not self._kwargs.get('min_height'):
-            self._kwargs['min_height'] = MINHEIGHT
+            # the edge rotor (see edge_polygon)
+        cradius = self._kwargs['cell_radius']
+        ewidth = self._kwargs['edge_width']
+        self._rotor = rect(cradius - 1, ewidth/2)
 
-    def sketch_cell(self, sketcher, cell):
-        """sketch a cell of the maze"""
-        i, j = cell.index
+    def _center(self, index):
+        """the center of the cell with the given index"""
+        i, j = index
         sradius = self._kwargs['outer_ring'] if i==0 \
             else self._kwargs['inner_ring']
-        cradius = self._kwargs['cell_radius']
         xorigin, yorigin = self._kwargs['sketch_origin']
-        theta = 2*pi*j / self.n
-        xcenter = sradius * cos(theta) + xorigin
-        ycenter = sradius * sin(theta) + yorigin
-        center = (xcenter, ycenter)
+        xcenter = sradius * self._cos[j] + xorigin
+        ycenter = sradius * self._sin[j] + yorigin
+        return (xcenter, ycenter)
+
+    def sketch_cell(self, sketcher, cell):
+        """sketch a cell of the maze
+
+        Returns the center of the cell.
+        """
+        cradius = self._kwargs['cell_radius']
+        center = self._center(cell.index)
         fill = cell.color if cell.color else "white"
         sketcher.draw_circle(center, cradius, fill=fill)
-        cell.sketch_center = center     # save the cell's center
+        return center
 
     def sketch_edge(self, sketcher, cell1, cell2):
-        """sketch a cell of the maze"""
-        cradius = self._kwargs['cell_radius']
-        ewidth = self._kwargs['edge_width']
+        """sketch an edge of the maze"""
+        center1 = self._center(cell1.index)
+        center2 = self._center(cell2.index)
+        polygon = self.edge_polygon(center1, center2, self._rotor)
+        if polygon:
+            sketcher.draw_polygon(polygon, "white")
 
-        xi0, yi0 = cell1.sketch_center    # center of cell1
-        xj0, yj0 = cell2.sketch_center    # center of cell2
-
-            # length of line connecting the centers:
-            #     d(P,Q) = sqrt(dx^2 + dy^2)
-        ds = sqrt((xi0-xj0)**2 + (yi0-yj0)**2)
-
-            # coordinates of the intersections with the cell
-            # walls...
-        xi1 = xi0 + (xj0-xi0) * cradius/ds
-        yi1 = yi0 + (yj0-yi0) * cradius/ds
-        xj1 = xj0 + (xi0-xj0) * cradius/ds
-        yj1 = yj0 + (yi0-yj0) * cradius/ds
-
-            # angle of incidence from cell i to cell j
-        dx, dy = xi1-xi0, yi1-yi0
-        if dy >= 0:
-                # Quadrants I and II
-            theta = acos(dx/cradius)
-        elif dx >= 0:
-                # Quadrant IV
-            theta = asin(dy/cradius)
-        else:
-                # Quadrand III
-            theta = pi + atan(dy/dx)
-
-            # angle of incidence from cell j to cell i
-        dx, dy = xj1-xj0, yj1-yj0
-        if dy >= 0:
-                # Quadrants I and II
-            phi = acos(dx/cradius)
-        elif dx >= 0:
-                # Quadrant IV
-            phi = asin(dy/cradius)
-        else:
-                # Quadrand III
-            phi = pi + atan(dy/dx)
-
-        epsilon = ewidth/2
-        r = cradius - 1
-
-        x1, y1 = r*cos(theta+epsilon), r*sin(theta+epsilon)
-        x1, y1 = x1 + xi0, y1 + yi0
-        x2, y2 = r*cos(theta-epsilon), r*sin(theta-epsilon)
-        x2, y2 = x2 + xi0, y2 + yi0
-
-        x3, y3 = r*cos(phi+epsilon), r*sin(phi+epsilon)
-        x3, y3 = x3 + xj0, y3 + yj0
-        x4, y4 = r*cos(phi-epsilon), r*sin(phi-epsilon)
-        x4, y4 = x4 + xj0, y4 + yj0
-
-        polygon = ((x1,y1), (x2,y2), (x3,y3), (x4,y4))
-        sketcher.draw_polygon(polygon, "white")
+    def edge_polygon(self, center1, center2, rotor):
+        """the polygon representing an edge of the maze
+
+        ARGUMENTS
+
+            center1, center2 - the centers of the cells at either end
+                of the edge
+            rotor - a complex number whose modulus is just inside the
+                cell radius and whose argument is half the edge width
+
+        RETURNS
+
+            a tuple of four vertices, or None if the two centers
+            coincide (there is no direction to draw in)
+        """
+        z1, z2 = complex(*center1), complex(*center2)
+
+            # unit vector in the direction from cell 1 to cell 2
+        dz = z2 - z1
+        ds = abs(dz)
+        if ds < 1e-9:
+            return None             # degenerate edge
+        u = dz / ds
+
+            # multiplying u by the rotor turns it by half the edge width
+            # and scales it to (just inside) the cell wall -- the
+            # conjugate turns it the other way
+        v1, v2 = u * rotor, u * rotor.conjugate()
+
+        vertices = (z1 + v1, z1 + v2, z2 - v1, z2 - v2)
+        return tuple((z.real, z.imag) for z in vertices)
+
+    def _edge_polygons(self):
+        """the polygons for all the passages, computed in bulk"""
+        rotor = self._rotor
+        centers = self._centers
+        polygons = []
+        for (index1, index2), src, dst in \
+                zip(self._edges, self._edge_src, self._edge_dst):
+            cell1, cell2 = self[index1], self[index2]
+            if not (cell1 and cell2):
+                continue            # a cell was deleted
+            if cell1.isLinkedTo(cell2) or cell2.isLinkedTo(cell1):
+                polygon = self.edge_polygon(centers[src], centers[dst],
+                                            rotor)
+                if polygon:
+                    polygons.append(polygon)
+        return polygons
 
     def sketch_prologue(self, sketcher):
         """prologue to sketching"""
@@ -312,29 +323,13 @@ class PetersenGrid(Grid):
                       height=self.sketch_height)
         self.sketch_prologue(sketcher)
 
-        for cell in self.each_cell():
-            self.sketch_cell(sketcher, cell)
-
-        for i in range(self.n):
-            index = (0, i)
-            cell1 = self[index]
-            if not cell1:
-                continue            # cell was deleted
-            for cell2 in cell1.neighbors:
-                if cell1.isLinkedTo(cell2) or cell2.isLinkedTo(cell1):
-                    self.sketch_edge(sketcher, cell1, cell2)
-
-            index = (1, i)
-            cell1 = self[index]
-            if not cell1:
-                continue            # cell was deleted
-            for cell2 in cell1.neighbors:
-                if cell2.index[0] == 0:
-                    continue
-                if cell1.isLinkedTo(cell2) or cell2.isLinkedTo(cell1):
-                    self.sketch_edge(sketcher, cell1, cell2)
-
+        self._centers = [None] * (2*self.n)     # cell centers
+        for index, cell in self._cells.items():
+            center = self.sketch_cell(sketcher, cell)
+            self._centers[self._id(index)] = center
 
+        for polygon in self._edge_polygons():
+            sketcher.draw_polygon(polygon, "white")
 
         self.sketch_epilogue(sketcher)
         sketcher.close(filename=filename, show=show)
@@ -44,7 +44,7 @@ LICENSE
         <https://www.gnu.org/licenses/>.
 """
 
-from math import sin, cos, pi, floor
+from math import sin, cos, tau
 from random import random, choice, randrange
 
 from cell import SquareCell
@@ -53,6 +53,10 @@ from grid import RectangularGrid
 class PolarCell(SquareCell):
     """cells in a polar grid"""
 
+    __slots__ = ('index', 'i', 'j', 'theta1', 'theta2',
+                 '_ccw', '_cw', '_inward')
+    polecell = False
+
     def initialize(self):
         """initialization
 
@@ -68,11 +72,16 @@ class PolarCell(SquareCell):
         self.i, self.j = self.index
         self.theta1 = self._kwargs.get('theta1', 0)
         self.theta2 = self._kwargs.get('theta1', 1)
-        self.polecell = isinstance(self, PoleCell)
+
+            # direct references to the neighbors used by the passage
+            # carvers, set by PolarGrid.configure_row
+        self._ccw = self._cw = self._inward = None
 
 class PoleCell(PolarCell):
     """cells in a polar grid"""
-    pass
+
+    __slots__ = ()
+    polecell = True
 
 class PolarGrid(RectangularGrid):
     """PolarGrid - implementation of the basic circular grid"""
@@ -94,6 +103,11 @@ class PolarGrid(RectangularGrid):
 
             cell_ratio - the ideal ratio of the cell's inner arc to its
                thickness (default: 1, minimum: 1)
+
+        The row geometry (column_cells, column_splits and row_offsets)
+        is computed once by initialize and reused by the configuration
+        passes.  Cell (i, j) is cell number row_offsets[i] + j, that is,
+        the entry at that position in the flat list of cells.
         """
         assert rows >= 1
         assert mincols >= 1
@@ -102,6 +116,8 @@ class PolarGrid(RectangularGrid):
         self.mincols = mincols
         self.column_cells = [mincols]
         self.column_splits = []
+        self.row_offsets = [0]
+        self._flat = []         # the cells, row by row
         self.ratio = max(0.1, kwargs.get('cell_ratio', 1))
 
             # we pass the arguments to the parent class
@@ -112,18 +128,20 @@ class PolarGrid(RectangularGrid):
         rows = self.rows
         lengths = self.column_cells
         splits = self.column_splits
+        offsets = self.row_offsets
+        flat = self._flat
         ratio = self.ratio
 
         for i in range(rows):
                 # determine how to split going outward
             cols = lengths[i]           # number of columns in this row
-            theta = 2*pi*i/cols         # length of outer wall
-            split = 1 if cols>1 else 2  # force a pole cell to split
-            if floor(theta) > ratio:
-                nsplit = int(floor(theta/ratio))
-                split = max(split, nsplit)
+            theta = tau*(i+1)/cols      # length of outer wall
+            split = max(1, int(theta/ratio))
+            if cols == 1:
+                split = max(split, 2)   # force a pole cell to split
             splits.append(split)        # outward neighbors per cell
             lengths.append(cols*split)  # number of cells in next row
+            offsets.append(offsets[-1] + cols)  # cells in prior rows
 
                 # create the cells
             if cols > 1:
@@ -134,11 +152,13 @@ class PolarGrid(RectangularGrid):
                     cell = PolarCell(index=(i,j), theta1=theta1,
                                      theta2=theta2)
                     self[cell.index] = cell
+                    flat.append(cell)
                         # inward nodes
                     self._nodes[(i, j)] = self.Node(i, j)                   
             else:       # a single cell at the pole
                 cell = PoleCell()
                 self[cell.index] = cell
+                flat.append(cell)
 
             # outward nodes for last row
         lengths.pop()
@@ -148,102 +168,126 @@ class PolarGrid(RectangularGrid):
 
         self.column_cells = lengths
         self.column_splits = splits
+        self.row_offsets = offsets
+
+            # the outward directions: 'out0', 'out1', ...
+        self._outward = tuple(self.OUTWARD + f'{k}'
+            for k in range(max(splits)))
 
     def configure(self):
-        """finish building the cells"""
-        self.configure_walls()
-        self.configure_neighborhood()
+        """finish building the cells
+
+        The walls and the neighborhoods are built together in a single
+        pass, one row at a time, working outward from the pole.
+        """
+        for i in range(self.rows):
+            self.configure_row(i)
         if self._kwargs.get(self.WALLBUILDER):
             self.configure_passages()
 
-    def configure_walls(self):
-        """build the cell boundaries"""
-        rows = self.rows
-        lengths = self.column_cells
-        splits = self.column_splits
-        
-        for i in range(rows):
-            cols = lengths[i]
-            split = splits[i]
-            for j in range(cols):
-                index = (i,j)
-                cell = self[index]
-                    # inward wall
-                if cols > 0:
-                    sw = (i, j)
-                    cell.set_node(sw)
-                    se = (i, (j+1)%cols)
-                    cell.set_node(se)
-                    swall = self._build_wall(sw, se)
-                    cell.set_wall(self.INWARD, swall)
-
-                    nw = (i+1, split*j)
-                    cell.set_node(nw)
-                    wwall = self._build_wall(sw, nw)
-                    cell.set_wall(self.CCW, swall)
-
-                    ne = (i+1, (split*(j+1))%(split*cols))
-                    cell.set_node(ne)
-                    ewall = self._build_wall(se, ne)
-                    cell.set_wall(self.CW, ewall)
-
-                for k in range(split):
-                    nw = (i+1, split*j+k)
-                    cell.set_node(nw)
-                    ne = (i+1, (split*j+k+1)%(split*cols))
-                    cell.set_node(ne)
-                    nwall = self._build_wall(sw, se)
-                    cell.set_wall(self.OUTWARD + f'{k}', nwall)
-
-    def configure_neighborhood(self):
-        """identify the cell's neighbors"""
-        rows = self.rows
-        lengths = self.column_cells
-        splits = self.column_splits
+    def configure_row(self, i):
+        """build the cell boundaries and identify the neighbors in a row
 
-        for i in range(rows):         # ordinates or y values
-            cols = lengths[i]
-            split = splits[i]
-            for j in range(cols):     # abscissae or x-values
-                index = (i, j)
-                cell = self[index]
-
-                    # neighboring face coordinates (except inward)
-
-                if not cell.polecell:
-                    ccw = (i, (j-1)%cols)
-                    cell[self.CCW] = self[ccw]
-                    cw = (i, (j+1)%cols)
-                    cell[self.CW] = self[cw]
-
-                if i + 1 == rows:
-                    continue          # no neighbors for outer row
-
-                for k in range(split):
-                    outward = (i+1, (split*j+k))
-                    nbr = self[outward]
-                    if nbr:
-                        direction = self.OUTWARD + f'{k}'
-                        cell[direction] = nbr
-                        nbr[self.INWARD] = cell
+        A wall is determined by a cell and a direction, so a wall which
+        has already been built by a neighbor is taken from that
+        neighbor rather than looked up by its nodes.  The inward wall
+        and the inward neighbor of a cell are assigned when the row
+        inside it is configured, and its counterclockwise wall is the
+        clockwise wall of its predecessor in the row.
+
+        Besides the neighborhood proper, the counterclockwise, clockwise
+        and inward neighbors are recorded in the cell attributes _ccw,
+        _cw and _inward for the passage carvers.
+        """
+        cols = self.column_cells[i]
+        split = self.column_splits[i]
+        outer = split * cols            # cells in the next row
+        base = self.row_offsets[i]
+        flat = self._flat
+        outward = self._outward
+        outermost = i + 1 == self.rows  # no outward neighbors
+        ring = cols > 1                 # a pole cell has no ring nbrs
+        if not outermost:
+            outer_base = self.row_offsets[i+1]
+
+        west = 0                        # first outward node of cell
+        for j in range(cols):
+            cell = flat[base + j]
+            east = west + split         # last outward node of cell
+            if east == outer:
+                east = 0
+
+                # inward wall
+            sw = (i, j)
+            cell.set_node(sw)
+            se = (i, j+1 if j+1 < cols else 0)
+            cell.set_node(se)
+            if i == 0:
+                swall = self._build_wall(sw, se)
+                cell.set_wall(self.INWARD, swall)
+
+            nw = (i+1, west)
+            cell.set_node(nw)
+            if j > 0:
+                wwall = flat[base + j-1].get_wall(self.CW)
+            else:
+                wwall = self._build_wall(sw, nw)
+            cell.set_wall(self.CCW, wwall)
+
+            ne = (i+1, east)
+            cell.set_node(ne)
+            ewall = self._build_wall(se, ne)
+            cell.set_wall(self.CW, ewall)
+
+                # neighboring faces in the row
+
+            if ring:
+                cell[self.CCW] = cell._ccw = flat[base + (j-1)%cols]
+                cell[self.CW] = cell._cw = flat[base + (j+1)%cols]
+
+                # outward walls and neighbors
+            node1 = nw
+            for k in range(split):
+                node2 = (i+1, west+k+1) if k+1 < split else ne
+                cell.set_node(node2)
+                nwall = self._build_wall(node1, node2)
+                direction = outward[k]
+                cell.set_wall(direction, nwall)
+                if not outermost:
+                    nbr = flat[outer_base + west+k]
+                    cell[direction] = nbr
+                    nbr[self.INWARD] = nbr._inward = cell
+                    nbr.set_wall(self.INWARD, nwall)
+                node1 = node2
+            west += split
 
     def configure_passages(self):
         """carve passages through all internal walls"""
-        for cell in self.each_cell():
-            for nbr in cell.passages:
+        for cell in self._flat:
+            for nbr in cell.neighbors:
                 cell.linkto(nbr)
 
+    def each_cell(self):
+        """generator for all the cells, row by row
+
+        The cells are taken from the flat list built by initialize
+        rather than looked up index by index.
+        """
+        for cell in self._flat:
+            yield cell
+
     def _build_wall(self, node1, node2):
         """erect the facial walls
 
         the walls are undirected with respect to the nodes, so
-        we must take care.
+        we must take care.  The nodes are (row, column) pairs, so the
+        wall is keyed by the ordered pair of its nodes.
         """
-        index = frozenset([node1, node2])
-        if index in self._walls:
-            return self._walls[index]
-        wall = self.Wall(node1, node2)
-        self._walls[index] = wall
+        index = (node1, node2) if node1 <= node2 else (node2, node1)
+        wall = self._walls.get(index)
+        if wall is None:
+            wall = self.Wall(node1, node2)
+            self._walls[index] = wall
         return wall
 
     def __str__(self):
@@ -258,11 +302,8 @@ class PolarGrid(RectangularGrid):
         The order of the cells can be modified using the 'split' and
         'reverse' keyword arguments.
         """
-        lengths = self.column_cells
-        cols = lengths[i]
-        cells = []
-        for j in range(cols):
-            cells.append(self[(i, j)])
+        offsets = self.row_offsets
+        cells = self._flat[offsets[i]:offsets[i+1]]
         if split:
             cells = cells[split:] + cells[:split]
         if reverse:
@@ -302,6 +343,42 @@ class PolarGrid(RectangularGrid):
         if not self._kwargs.get('edge_width'):
             self._kwargs['edge_width'] = EDGEWIDTH
 
+            # the parameters used for each cell and edge
+        self._center = (self.sketch_width/2, self.sketch_height/2)
+        self._sradius = self._kwargs['sketch_radius']
+        self._inset = self._kwargs['inset']
+        self._outline = self._kwargs['outline']
+        self._edge_width = self._kwargs['edge_width']
+
+            # per-row radii and angular inset, and the directions of
+            # the radial axes of the cells (shared by rows of equal
+            # length)
+        rows = self.rows
+        sradius = self._sradius
+        inset = self._inset
+        self._row_radii = []
+        self._row_axes = []
+        axes = {}
+        cosine, sine = cos, sin         # local names for the loop
+        for i in range(rows):
+            cols = self.column_cells[i]
+            r1 = (i+1-inset)/rows * sradius     # outer radius
+            r2 = (i+inset)/rows * sradius       # inner radius
+
+                # get a reasonable inset
+            dtheta = inset / cols
+            ds = r2 * tau * dtheta          # outer width of dtheta
+            dr = inset * sradius / rows     # radial inset
+            if dr < ds:
+                dtheta = dr / (r2 * tau)
+            self._row_radii.append((r1, r2, dtheta))
+
+            if cols not in axes:
+                thetas = [(2*j+1) / (2*cols) * tau for j in range(cols)]
+                axes[cols] = [(cosine(theta), sine(theta))
+                    for theta in thetas]
+            self._row_axes.append(axes[cols])
+
     @property
     def sketch_width(self):
         return 2 * (self._kwargs['sketch_radius'] + \
@@ -314,19 +391,13 @@ class PolarGrid(RectangularGrid):
 
     def sketch_cell(self, sketcher, cell):
         """sketch a single cell"""
-        sradius = self._kwargs['sketch_radius']
-        inset = self._kwargs['inset']
-        outline = self._kwargs['outline']
+        outline = self._outline
 
-        x0, y0 = self.sketch_width/2, self.sketch_height/2  # center
-        center = (x0,y0)
+        center = self._center
 
         i, j = cell.index
-        rows = self.rows
         cols = self.column_cells[i]
-
-        r1 = (i+1-inset)/rows           # outer radius
-        r1 *= sradius
+        r1, r2, dtheta = self._row_radii[i]     # see sketch_setup
 
         color = cell.color if cell.color else "white"
 
@@ -334,24 +405,45 @@ class PolarGrid(RectangularGrid):
             sketcher.draw_circle(center, r1,
                                  outline=outline, fill=color)
         else:
-            r2 = (i+inset)/rows             # inner radius
-            r2 *= sradius
             theta1 = j / cols               # in revolutions
             theta2 = (j+1) / cols
 
-                # get a reasonable inset
-            dtheta = inset / cols
-            ds = r2 * 2* pi* dtheta         # outer width of dtheta
-            dr = inset * sradius / rows     # radial inset
-            if dr < ds:
-                dtheta = dr / (r2 * 2 * pi)
-
             theta1 += dtheta
             theta2 -= dtheta
 
             sketcher.draw_segment(center, r1, r2, theta1, theta2,
                                   fill=color, outline=outline)
 
+    def sketch_cells(self, sketcher):
+        """sketch all the cells, row by row
+
+        This has the same effect as calling sketch_cell for each cell,
+        but the row parameters and the angular bounds of the cells are
+        worked out once per row, and each row is handed to the sketcher
+        as a batch.
+        """
+        outline = self._outline
+        center = self._center
+
+        offsets = self.row_offsets
+        for i in range(self.rows):
+            cols = self.column_cells[i]
+            r1, r2, dtheta = self._row_radii[i]
+            cells = self._flat[offsets[i]:offsets[i+1]]
+            colors = [cell.color if cell.color else "white"
+                for cell in cells]
+
+            if cells[0].polecell:       # single cell at the pole
+                sketcher.draw_circle(center, r1,
+                                     outline=outline, fill=colors[0])
+                continue
+
+                # the angular bounds (in revolutions)
+            bounds = [(j/cols + dtheta, (j+1)/cols - dtheta)
+                for j in range(cols)]
+            sketcher.draw_segments(center, r1, r2, bounds, colors,
+                                   outline=outline)
+
     def sketch_inward_edge(self, sketcher, cell1, cell2,
                            color='white'):
         """sketch inward edges
@@ -361,32 +453,24 @@ class PolarGrid(RectangularGrid):
         Note that a PoleCell has no inward edges, so cell1 is not an
         instance of PoleCell.
         """
-        sradius = self._kwargs['sketch_radius']
-        inset = self._kwargs['inset']
-        outline = self._kwargs['outline']
-        width = self._kwargs['edge_width']
-        rows = self.rows
+        width = self._edge_width
 
-        x0, y0 = self.sketch_width/2, self.sketch_height/2  # center
+        x0, y0 = self._center
 
         i1, j1 = cell1.index
-        r1 = (i1+inset)/rows            # inner radius of cell1
-        r1 *= sradius
-
+        r1 = self._row_radii[i1][1]     # inner radius of cell1
         i2, j2 = cell2.index
-        r2 = (i2+1-inset)/rows          # outer radius of cell2
-        r2 *= sradius
+        r2 = self._row_radii[i2][0]     # outer radius of cell2
 
         r1 += 1                         # cut through outlines
         r2 -= 1
 
-        cols = self.column_cells[i1]
-        theta = (2*j1+1) / (2*cols)     # central radial axis (rev)
-        theta *= 2*pi                   # (radians)
+            # central radial axis of cell1
+        c, s = self._row_axes[i1][j1]
 
             # clockwise coordinates!
-        source = x0 + r1*cos(theta), y0 - r1*sin(theta)
-        sink = x0 + r2*cos(theta), y0 - r2*sin(theta)
+        source = x0 + r1*c, y0 - r1*s
+        sink = x0 + r2*c, y0 - r2*s
 
         sketcher.draw_line_segment(source, sink, fill=color,
                           thickness=width)
@@ -397,20 +481,13 @@ class PolarGrid(RectangularGrid):
 
         For the time being, we treat all edges are undirected.
         """
-        sradius = self._kwargs['sketch_radius']
-        inset = self._kwargs['inset']
-        outline = self._kwargs['outline']
-        width = self._kwargs['edge_width']
-        rows = self.rows
+        inset = self._inset
 
-        x0, y0 = self.sketch_width/2, self.sketch_height/2  # center
-        center = (x0,y0)
+        center = self._center
 
         i, j = cell1.index
-        r1 = (i+1-inset)/rows           # outer radius of cell1 and cell2
-        r1 *= sradius
-        r2 = (i+inset)/rows             # inner radius of cell1 and cell2
-        r2 *= sradius
+            # outer and inner radius of cell1 and cell2
+        r1, r2, _ = self._row_radii[i]
 
         width = r1 - r2
         r1 -= width / 4
@@ -461,13 +538,19 @@ class PolarGrid(RectangularGrid):
                       height=self.sketch_height)
 
         self.sketch_prologue(sketcher)
-        for cell in self.each_cell():
-            self.sketch_cell(sketcher, cell)
-
-        for cell1 in self.each_cell():
-            for cell2 in self.each_cell():
-                if cell1.isLinkedTo(cell2):
-                    self.sketch_edge(sketcher, cell1, cell2)
+        self.sketch_cells(sketcher)
+
+            # only inward and clockwise edges are sketched (see
+            # sketch_edge), so we need only look in those directions
+        for cell in self._flat:
+            nbr = cell[self.INWARD]
+            if nbr and cell.isLinkedTo(nbr):
+                self.sketch_inward_edge(sketcher, cell, nbr,
+                    color=self.edge_color(cell, nbr))
+            nbr = cell[self.CW]
+            if nbr and cell.isLinkedTo(nbr):
+                self.sketch_clockwise_edge(sketcher, cell, nbr,
+                    color=self.edge_color(cell, nbr))
 
         self.sketch_epilogue(sketcher)
 
@@ -618,19 +701,23 @@ class InWinder(object):
             row_choice = cls.random_choice
 
             # main
+            #   The generator is bound to a local since it is used once
+            #   per cell.  The neighbors are taken from the cell
+            #   attributes set by PolarGrid.configure_row.
+        coinflip = random
 
         rows = grid.rows
         lengths = grid.column_cells
+        run = []                        # reused for every run
         for i in range(rows):
             cols = lengths[i]
             curr = first = grid[(i, randrange(cols))]
             firsthit = True
-            run = []
             while curr and (curr != first or firsthit):
                 firsthit = False      # we make sure first is used
                 prev = curr
-                curr = curr[PolarGrid.CW]
-                can_go_inward = bool(prev[PolarGrid.INWARD])
+                curr = curr._cw
+                can_go_inward = bool(prev._inward)
                 can_go_forward = curr and curr != first
 
                 if can_go_inward:
@@ -639,20 +726,20 @@ class InWinder(object):
 
                 if can_go_forward:
                     if can_go_inward:
-                        if random() <= p:       # heads
+                        if coinflip() <= p:     # heads
                                 # go forward
                             prev.link(curr)
                         else:                   # tails
                                 # close out run and go inward
                             cell = row_choice(state, run)
-                            cell.link(cell[PolarGrid.INWARD])
-                            run = []
+                            cell.link(cell._inward)
+                            run.clear()
                 else:                           # last in row
                     if can_go_inward:
                             # close out run and go inward
                         cell = row_choice(state, run)
-                        cell.link(cell[PolarGrid.INWARD])
-                        run = []
+                        cell.link(cell._inward)
+                        run.clear()
 
             # housecleaning
         return maze
@@ -744,7 +831,8 @@ class OutWinder(InWinder):
     """
 
     @classmethod
-    def on(cls, maze, p=0.5, row_choice=None, state=None):
+    def on(cls, maze, p=0.5, row_choice=None, exit_choice=None,
+           state=None):
         """create an outwinder maze on a polar grid
 
         The arguments are as for InWinder.on with one addition...
@@ -828,23 +916,28 @@ class OutWinder(InWinder):
 
         rows = grid.rows
         lengths = grid.column_cells
+        run = []                        # reused for every run
+        outward_map = {}                # reused for every row
         for i in range(rows):
             cols = lengths[i]
+            outermost = i + 1 == rows   # a single chain
+
+                # the outward exits are fixed by the grid, so we
+                # collect them once for the whole row
+            outward_map.clear()
+            for cell in grid.row(i):
+                outward_map[cell] = [cell[direction] \
+                    for direction in cell.directions \
+                    if direction[:outlen] == outward]
+
             curr = first = grid[(i, randrange(cols))]
             firsthit = True
-            run = []
-            outward_exits = {}
             while curr and (curr != first or firsthit):
                 firsthit = False      # we make sure first is used
                 prev = curr
-                curr = curr[PolarGrid.CW]
-
-                outward_exits[prev] = []
-                for direction in prev.directions:
-                    if direction[:outlen] == outward:
-                        if prev[direction]:
-                            outward_exits[prev].append(prev[direction])
-                can_go_outward = bool(outward_exits[prev])
+                curr = curr._cw
+
+                can_go_outward = bool(outward_map[prev])
                 can_go_forward = curr and curr != first
 
                 if can_go_outward:
@@ -852,25 +945,25 @@ class OutWinder(InWinder):
                 can_go_outward = bool(run)
 
                 if can_go_forward:
-                    if can_go_inward:
+                    if can_go_outward:
                         if random() <= p:       # heads
                                 # go forward
                             prev.link(curr)
                         else:                   # tails
-                                # close out run and go inward
+                                # close out run and go outward
                             cell = row_choice(state, run)
-                            nbr = exit_choice(outward_exits[cell])
+                            nbr = exit_choice(state, outward_map[cell])
                             cell.link(nbr)
-                            run = []
-                            outward_exits = {}
+                            run.clear()
+                    elif outermost:
+                        prev.link(curr)
                 else:                           # last in row
-                    if can_go_inward:
-                            # close out run and go inward
+                    if can_go_outward:
+                            # close out run and go outward
                         cell = row_choice(state, run)
-                        nbr = exit_choice(outward_exits[cell])
+                        nbr = exit_choice(state, outward_map[cell])
                         cell.link(nbr)
-                        run = []
-                        outward_exits = {}
+                        run.clear()
 
             # housecleaning
         return maze
@@ -39,8 +39,8 @@ LICENSE
         <https://www.gnu.org/licenses/>.
 """
 
-from random import shuffle, choice, random
-from maze_support import Stack, Queue, Unqueue, Heap
+from random import shuffle, choice, random, randrange
+from maze_support import Stack, Queue, Heap, edge_key
 
 class SpanningSearchTree(object):
     """SpanningSearchTree - spanning tree using search
@@ -65,7 +65,8 @@ class SpanningSearchTree(object):
                 representation is used to mark the starting cell.
 
             queuing - a queuing _class_ which is duck-type compatible
-                with Stack, Queue or Heap in maze_support.  If queuing
+                with Stack, Queue or Heap in maze_support, including
+                truth testing for emptiness.  If queuing
                 is None (the default), then maze_support.Stack will
                 be used.
 
@@ -81,6 +82,13 @@ class SpanningSearchTree(object):
             then the algorithm is depth-first search.  Shuffling the
             neighborhood before stacking the neighbors produces a
             more interesting maze.
+
+            Neighbors which have already been adopted are never
+            queued.  With a FIFO queue (Queue), the first application
+            for a cell is always the one that is served first, so the
+            cell is adopted as soon as it is queued.  Other queuing
+            classes may serve later applications first, so for them
+            adoption waits until the cell is served.
         """
         grid = maze.grid
         if not root:
@@ -91,17 +99,21 @@ class SpanningSearchTree(object):
         queue = QueueClass() if QueueClass else Stack()
         if not priority:
             priority = lambda maze, cell1, cell2: 1
+        eager = isinstance(queue, Queue)    # adopt when queued
+        enter, serve = queue.enter, queue.serve
         queue.enter(None, root, priority=0)
-        visited = set([])
+        visited = set([root]) if eager else set([])
+        adopt = visited.add
 
-        while not queue.isEmpty:
-            parent, cell = queue.serve()
-            if cell in visited:
-                continue        # already adopted
+        while queue:
+            parent, cell = serve()
+            if not eager:
+                if cell in visited:
+                    continue        # already adopted
 
-            if parent:
-                parent.link(cell)     # adoption is complete
-            visited.add(cell)
+                if parent:
+                    parent.link(cell)     # adoption is complete
+                adopt(cell)
 
                 # now the cell applies to the adoption agency
                 # some possibilities are found, but no guarantees
@@ -109,8 +121,12 @@ class SpanningSearchTree(object):
             if shuffle_hood:
                 shuffle(neighbors)
             for nbr in neighbors:
-                queue.enter(cell, nbr,
-                            priority=priority(maze, cell, nbr))
+                if nbr in visited:
+                    continue        # already adopted
+                if eager:
+                    cell.link(nbr)
+                    adopt(nbr)
+                enter(cell, nbr, priority=priority(maze, cell, nbr))
 
         return maze
 
@@ -127,7 +143,9 @@ class DFSSpanningTree(object):
     def on(cls, maze, root=None, mark_root='', shuffle_hood=True):
         """carve a depth-first spanning search tree on an grid
 
-        This is just a simple filter.
+        This produces the same tree as SpanningSearchTree with a
+        Stack, but only the current path is stacked.  Each entry holds
+        a cell and an iterator over its remaining neighbors.
 
         REQUIRED ARGUMENTS
 
@@ -198,11 +216,34 @@ class DFSSpanningTree(object):
             Long twisting passages are characteristic of depth-first
             search.
         """
-        return SpanningSearchTree.on(maze, root=root,
-                                     mark_root=mark_root,
-                                     QueueClass=Stack,
-                                     priority=None,
-                                     shuffle_hood=shuffle_hood)
+        grid = maze.grid
+        if not root:
+            root = choice(grid.cells)
+        if mark_root:
+            root.text = repr(mark_root)[1]
+
+        def hood(cell):
+            """the neighbors in the order a stack would serve them"""
+            neighbors = cell.neighbors
+            if shuffle_hood:
+                shuffle(neighbors)
+            return reversed(neighbors)
+
+        visited = set([root])
+        stack = [(root, hood(root))]
+        while stack:
+            cell, neighbors = stack[-1]
+            for nbr in neighbors:
+                if nbr not in visited:
+                    break
+            else:
+                stack.pop()         # backtrack
+                continue
+            cell.link(nbr)
+            visited.add(nbr)
+            stack.append((nbr, hood(nbr)))
+
+        return maze
 
 class BFSSpanningTree(object):
     """BFSSpanningTree - spanning tree using breadth-first search
@@ -213,7 +254,9 @@ class BFSSpanningTree(object):
     def on(cls, maze, root=None, mark_root='', shuffle_hood=True):
         """carve a breadth-first spanning search tree on an grid
 
-        This is just a simple filter.
+        This produces the same tree as SpanningSearchTree with a
+        Queue.  The frontier is a list that is read in order while
+        it grows, and cells are adopted as they join it.
 
         REQUIRED ARGUMENTS
 
@@ -282,11 +325,25 @@ class BFSSpanningTree(object):
             Breadth-first search favors passages the branch very early,
             much like a spider web.
         """
-        return SpanningSearchTree.on(maze, root=root,
-                                     mark_root=mark_root,
-                                     QueueClass=Queue,
-                                     priority=None,
-                                     shuffle_hood=shuffle_hood)
+        grid = maze.grid
+        if not root:
+            root = choice(grid.cells)
+        if mark_root:
+            root.text = repr(mark_root)[1]
+
+        visited = set([root])
+        frontier = [root]
+        for cell in frontier:       # the frontier grows as we go
+            neighbors = cell.neighbors
+            if shuffle_hood:
+                shuffle(neighbors)
+            for nbr in neighbors:
+                if nbr not in visited:
+                    cell.link(nbr)
+                    visited.add(nbr)
+                    frontier.append(nbr)
+
+        return maze
 
 class RFSSpanningTree(object):
     """RFSSpanningTree - spanning tree using random-first search
@@ -325,7 +382,8 @@ class RFSSpanningTree(object):
     def on(cls, maze, root=None, mark_root=''):
         """carve a random-first spanning search tree on an grid
 
-        This is just a simple filter.
+        This produces the same tree as SpanningSearchTree with an
+        Unqueue, with the unqueue operations written inline.
 
         REQUIRED ARGUMENTS
 
@@ -345,11 +403,30 @@ class RFSSpanningTree(object):
             Shuffling of neighborhoods is unnecessary and thus not
             supported.
         """
-        return SpanningSearchTree.on(maze, root=root,
-                                     mark_root=mark_root,
-                                     QueueClass=Unqueue,
-                                     priority=None,
-                                     shuffle_hood=False)
+        grid = maze.grid
+        if not root:
+            root = choice(grid.cells)
+        if mark_root:
+            root.text = repr(mark_root)[1]
+
+        visited = set([])
+        frontier = [(None, root)]
+        while frontier:
+                # serve a random package; the last one fills the hole
+            i = randrange(len(frontier))
+            parent, cell = frontier[i]
+            frontier[i] = frontier[-1]
+            frontier.pop()
+            if cell in visited:
+                continue            # already adopted
+            if parent:
+                parent.link(cell)
+            visited.add(cell)
+            for nbr in cell.neighbors:
+                if nbr not in visited:
+                    frontier.append((cell, nbr))
+
+        return maze
 
 class Prim(object):
     """Prim - Prim's minimum-weight spanning tree algorithm
@@ -404,30 +481,36 @@ class Prim(object):
                 representation is used to mark the starting cell.
 
             priority - a dictionary of priorities.  The keys are
-                undirected edges (frozenset([cell1, cell2])). The
+                undirected edges, either frozenset([cell1, cell2]) or
+                edge_key(cell1, cell2) from maze_support. The
                 values are positive real numbers.
 
         SIDE EFFECTS
 
             The Maze object will have a copy of the priority dictionary
             and the maximum priority (with minimum 1) that was given as
-            input.
+            input.  In the copy, the keys are edge_key pairs.
         """
 
         def prf(maze, cell1, cell2):
             """a priority function"""
-            key = frozenset([cell1, cell2])
-            if not key in maze.priority:
-                maze.priority[key] = maze.max_priority + random()
-            return maze.priority[key]
+            key = (cell1, cell2) if id(cell1) <= id(cell2) \
+                else (cell2, cell1)
+            pr = maze.priority.get(key)
+            if pr is None:
+                pr = maze.priority[key] = maze.max_priority + random()
+            return pr
 
             # housekeeping
         max_priority = 1
-        for pr in priority.values():
+        priorities = {}
+        for edge, pr in priority.items():
             if pr > max_priority:
                 max_priority = pr
+            cells = list(edge)          # a loop has just one cell
+            priorities[edge_key(cells[0], cells[-1])] = pr
 
-        maze.priority = priority.copy()
+        maze.priority = priorities
         maze.max_priority = max_priority
         
         return SpanningSearchTree.on(maze, root=root,
@@ -575,9 +658,10 @@ class FalsePrim(object):
 
         def prf(maze, cell1, cell2):
             """a priority function"""
-            if not cell2 in maze.priority:
-                maze.priority[cell2] = maze.max_priority + random()
-            return maze.priority[cell2]
+            pr = maze.priority.get(cell2)
+            if pr is None:
+                pr = maze.priority[cell2] = maze.max_priority + random()
+            return pr
 
             # housekeeping
         min_priority = float('inf')
@@ -38,7 +38,7 @@ LICENSE
         <https://www.gnu.org/licenses/>.
 """
 
-from random import random, choice
+from random import random, randrange
 
 class Sidewinder(object):
     """Sidewinder - the sidewinder maze passage carver
@@ -69,33 +69,31 @@ class Sidewinder(object):
     @classmethod
     def on(cls, maze, p=0.5):
         """carve a sidewinder tree on a rectangular grid"""
-        east, north = 'east', 'north'
         grid = maze.grid
+            # on a rectangular grid, the east neighbor of cells[i][j]
+            # is cells[i][j+1] and its north neighbor is cells[i+1][j]
+        cells = [grid.row(i) for i in range(grid.rows)]
         for i in range(grid.rows-1):
-            run = []
+            row, above = cells[i], cells[i+1]
+            start = 0                 # the run is range(start, j+1)
             for j in range(grid.cols-1):
-                run.append(j)
                 rand = random()       # the digger flips a coin
                 if rand < p:              # heads it is!
-                    cell = grid[(i,j)]
-                    cell.link(cell[east])
+                    row[j].link(row[j+1])
                     continue
-                k = choice(run)       # carve north somewhere
-                cell = grid[(i,k)]
-                cell.link(cell[north])
-                run = []              # close the run
+                k = start + randrange(j + 1 - start)    # carve north
+                row[k].link(above[k])
+                start = j + 1         # close the run
 
                 # end of row
             j = grid.cols-1           # last cell in row
-            run.append(j)
-            k = choice(run)
-            cell = grid[(i,k)]
-            cell.link(cell[north])
-
-        i = grid.rows - 1
-        for j in range(grid.cols-1):
-            cell = grid[(i, j)]
-            cell.link(cell[east])
+            k = start + randrange(j + 1 - start)
+            row[k].link(above[k])
+
+            # the top row is a single run
+        row = cells[grid.rows-1]
+        for cell, nbr in zip(row, row[1:]):
+            cell.link(nbr)
 
         return maze
 
@@ -138,6 +138,11 @@ class TorusGrid(RectangularGrid):
                     v               ^       ^
     """
 
+    def initialize(self):
+        """create the directories of available nodes and faces"""
+        self._wall_cache = None     # (version, wall lines)
+        super().initialize()
+
     def transform(self, x, y):
         """coordinate transformation
 
@@ -150,47 +155,41 @@ class TorusGrid(RectangularGrid):
         """
         return (x % self.cols, y % self.rows)
 
-    def __str__(self):
-        """string representation of the maze"""
-            # assemble the string image, row by row
-        s = ''
-        s += '    C  ' + '    ' * (self.cols - 2) + ' D\n'
-        marker1 = 'A '
-        marker2 = ' A\n'
-        for i in range(self.rows-1, -1, -1):
-            row = self.row(i)
-            s += marker1 + self._make_wall(i, row) + marker2 
-            marker1 = '  '
-            marker2 = '\n'
-            s += marker1 + self._make_faces(i, row) + marker2
-        row = self.row(0)
-        s += 'B '
-        s += self._make_wall(0, row, direction=self.SOUTH,
-                             walls=['   ', ' ^ ', ' v ', '---'])
-        s += ' B\n'
-        s += '    C  ' + '    ' * (self.cols - 2) + ' D'
+    def _wall_lines(self):
+        """helper for __str__
 
-        return s
+        Returns a list of the horizontal walls: entry i is the north
+        wall of row i, and the last entry is the south wall of row 0.
+        Unlike the rows of faces, the walls do not depend on the cell
+        markers, so they are kept until a passage changes.
+        """
+        version = self.version
+        if self._wall_cache and self._wall_cache[0] == version:
+            return self._wall_cache[1]
+        lines = [self._make_wall(i, self.row(i)) for i in range(self.rows)]
+        lines.append(self._make_wall(0, self.row(0), direction=self.SOUTH,
+                                     walls=['   ', ' ^ ', ' v ', '---']))
+        self._wall_cache = (version, lines)
+        return lines
 
     def __str__(self):
         """string representation of the maze"""
             # assemble the string image, row by row
-        s = ''
+        parts = []
+        walls = self._wall_lines()
         marker1 = 'A '
         marker2 = ' A\n'
         for i in range(self.rows-1, -1, -1):
             row = self.row(i)
-            s += marker1 + self._make_wall(i, row) + marker2 
+            parts.extend((marker1, walls[i], marker2))
             marker1 = '  '
             marker2 = '\n'
-            s += marker1 + self._make_faces(i, row) + marker2
-        row = self.row(0)
-        s += 'B '
-        s += self._make_wall(0, row, direction=self.SOUTH,
-                             walls=['   ', ' ^ ', ' v ', '---'])
-        s += ' B'
-
-        return s
+            parts.extend((marker1, self._make_faces(i, row), marker2))
+        parts.append('B ')
+        parts.append(walls[-1])
+        parts.append(' B')
+
+        return ''.join(parts)
 
     def sketch_setup(self):
         """sketch parameter setup"""
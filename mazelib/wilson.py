@@ -35,6 +35,7 @@ LICENSE
 """
 
 from random import choice
+from maze_support import IndexedSet
 
 class Wilson(object):
     """Wilson - implementation of Wilson's unbiased spanning tree
@@ -149,34 +150,47 @@ class Wilson(object):
             call that cell the oasis.  This advantage comes free
             of cost.
         """
-        unvisited = set(maze.grid.cells)
-        start = choice(maze.grid.cells)
+        unvisited = IndexedSet(maze.grid.cells)
+        start = unvisited.choice()
         unvisited.discard(start)          # start of civilizarion
+            # the neighborhoods do not change while we carve
+        hoods = {cell: tuple(cell.neighbors) for cell in unvisited}
 
         while unvisited:
-            path = cls.circuit_erased_walk(unvisited, debug=debug)
+            path = cls.circuit_erased_walk(unvisited, debug=debug,
+                                           hoods=hoods)
             for i in range(len(path) - 1):
                 curr, step = path[i:i+2]
                 curr.link(step)           # follow the path
                 unvisited.discard(step)   # expand civilization
 
     @staticmethod
-    def circuit_erased_walk(unvisited, debug=False):
+    def circuit_erased_walk(unvisited, debug=False, hoods=None):
         """one pass of Wilson's algorithm, read only
 
             "That's one small step for (a) man, one giant leap
             for mankind." -- Neil Armstrong, July 20, 1969
+
+        The unvisited cells are ideally an IndexedSet (from
+        maze_support); any other collection is copied into one.  If
+        given, hoods maps each unvisited cell to a tuple of its
+        neighbors.  Cells missing from hoods are looked up as needed.
         """
+        if not isinstance(unvisited, IndexedSet):
+            unvisited = IndexedSet(unvisited)
+        if hoods is None:
+            hoods = {}
         trail = {}
             # teleport to desert oasis
-        oasis = choice(list(unvisited))
+        oasis = unvisited.choice()
         trail[oasis] = None
 
         n = 0
         curr = oasis
+        wander = choice                   # local name for the walk
         while curr in unvisited:          # still in the desert
             n += 1                        # step count
-            step = choice(curr.neighbors)
+            step = wander(hoods.get(curr) or tuple(curr.neighbors))
             if step not in trail:         # someplace new
                 trail[step] = curr
             curr = step                   # continue from here
@@ -41,36 +41,7 @@ import mazelib
 from torus_grid import TorusGrid
 from maze import Maze
 from aldous_broder import AldousBroder
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import euler_characteristic
 
 if __name__ == '__main__':
     import argparse
@@ -91,7 +62,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     AldousBroder.on(maze, method=AldousBroder.plain)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -105,7 +76,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     AldousBroder.on(maze, method=AldousBroder.vanilla)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -118,25 +89,27 @@ if __name__ == '__main__':
           'blueberry (first-entrance) Aldous-Broder on a toroidal grid')
     grid = TorusGrid(rows, cols)
     maze = Maze(grid)
+    ncells = len(grid.cells)
     print('set breakpoint after 30 cells...')
     AldousBroder.on(maze, method=AldousBroder.blueberry,
         init=True, debug=True,
-        min_cells = len(grid.cells) // 2)
+        min_cells = ncells // 2)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
 
+    half_unvisited = len(maze.unvisited) // 2
     print('set breakpoint after 15 cells...')
     AldousBroder.on(maze, method=AldousBroder.blueberry,
         debug=True,
-        min_cells = len(maze.unvisited) // 2)
+        min_cells = half_unvisited)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
 
     print('finish run...')
     AldousBroder.on(maze, method=AldousBroder.blueberry,
         debug=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -42,36 +42,7 @@ from grid import RectangularGrid
 from maze import Maze
 from recursive_backtracker import DFSSpanningTree, BFSSpanningTree, \
     RFSSpanningTree, Prim, FalsePrim
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import euler_characteristic, edge_key
 
 if __name__ == '__main__':
     import argparse
@@ -91,7 +62,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     DFSSpanningTree.on(maze, mark_root=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -104,7 +75,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     DFSSpanningTree.on(maze, mark_root=True, shuffle_hood=False)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -117,7 +88,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     BFSSpanningTree.on(maze, mark_root=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -130,7 +101,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     BFSSpanningTree.on(maze, mark_root=True, shuffle_hood=False)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -145,7 +116,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     RFSSpanningTree.on(maze, mark_root=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -156,16 +127,13 @@ if __name__ == '__main__':
     print('Test 6)', 'Prim\'s minimum weight spanning tree')
     grid = RectangularGrid(rows, cols)
     maze = Maze(grid)
-    priorities = {}
-    for cell in grid.cells:
-        for nbr in cell.neighbors:
-            key = frozenset([cell, nbr])
-            if key in priorities:
-                continue
-            priorities[key] = 1 + random()
+        # each edge is listed once, from its endpoint with lower id
+    edges = [edge_key(cell, nbr) for cell in grid.cells
+             for nbr in cell.neighbors if id(cell) <= id(nbr)]
+    priorities = {edge: 1 + random() for edge in edges}
     Prim.on(maze, mark_root=True, priority=priorities)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -174,9 +142,9 @@ if __name__ == '__main__':
         print('Oops! Not a spanning tree!')
     net_weight = 0
     for wall in priorities:
-        if len(wall) < 2:
+        cell1, cell2 = wall
+        if cell1 is cell2:
             continue
-        cell1, cell2 = list(wall)
         if cell1.isLinkedTo(cell2):
             net_weight += priorities[wall]
     print('Weight of maze:', net_weight)
@@ -185,12 +153,10 @@ if __name__ == '__main__':
     print('Test 7)', 'False Prim spanning tree (using cell weights)')
     grid = RectangularGrid(rows, cols)
     maze = Maze(grid)
-    priorities = {}
-    for cell in grid.cells:
-        priorities[cell] = 1 + random()
+    priorities = {cell: 1 + random() for cell in grid.cells}
     FalsePrim.on(maze, mark_root=True, priority=priorities)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -42,37 +42,7 @@ from grid import RectangularGrid
 from maze import Maze
 from binary_search_tree import DFSBinaryTree, BFSBinaryTree, \
     BinarySearchTree
-from maze_support import Heap
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import Heap, euler_characteristic, edge_key
 
 if __name__ == '__main__':
     import argparse
@@ -92,7 +62,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     DFSBinaryTree.on(maze, mark_root='X')
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
 
@@ -101,7 +71,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     BFSBinaryTree.on(maze, mark_root='X')
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
 
@@ -110,7 +80,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     BinarySearchTree.on(maze, mark_root='X')
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
 
@@ -124,7 +94,7 @@ if __name__ == '__main__':
     startcell = None
     for cell in maze.grid.each_cell():
         for nbr in cell.neighbors:
-            key = frozenset([cell, nbr])
+            key = edge_key(cell, nbr)
             if not key in maze.myweights:
                 wgt = random()
                 maze.myweights[key] = wgt
@@ -133,14 +103,14 @@ if __name__ == '__main__':
                     startcell = cell
 
     pr = lambda maze, cell1, cell2: \
-          maze.myweights[frozenset([cell1, cell2])]
+          maze.myweights[edge_key(cell1, cell2)]
 
     heap = Heap()
 
     BinarySearchTree.on(maze, root=startcell,
                         mark_root='X', queue=heap, priority=pr)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
 
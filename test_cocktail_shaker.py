@@ -40,37 +40,7 @@ from grid import RectangularGrid
 from maze import Maze
 from binary_tree import BinaryTree
 from cocktail_shaker_tree import CocktailShakerTree
-from maze_support import Heap
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import Heap, euler_characteristic
 
 if __name__ == '__main__':
     import argparse
@@ -90,7 +60,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     BinaryTree.on(maze)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
 
@@ -99,7 +69,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     CocktailShakerTree.on(maze)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
 
@@ -39,36 +39,7 @@ import mazelib
 from cylinder_grid import CylinderGrid, BinaryTree, CocktailShaker, \
     Sidewinder
 from maze import Maze
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import euler_characteristic
 
 def grid_characteristic(maze, output=True):
     """determine the Euler characteristic of the grid
@@ -110,7 +81,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     BinaryTree.on(maze, mark_split=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -123,7 +94,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     CocktailShaker.on(maze, mark_split=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -136,7 +107,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     Sidewinder.on(maze, mark_split=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
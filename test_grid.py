@@ -40,6 +40,7 @@ from cell import Cell, SquareCell
 from grid import Grid, RectangularGrid
 from maze import Maze
 from binary_tree import BinaryTree
+from maze_support import euler_characteristic
 
 def grid_characteristic(maze, output=True):
     """determine the Euler characteristic of the grid
@@ -63,28 +64,6 @@ def grid_characteristic(maze, output=True):
     assert chi == expect, f'characteristic {chi}, expected {expect}'
     return chi
 
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = maze.v
-    e = maze.e
-    k = maze.k
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
-
 if __name__ == '__main__':
     import argparse
 
@@ -158,7 +137,7 @@ if __name__ == '__main__':
 
     chi = grid_characteristic(maze)
     assert chi == 0
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     assert chi == 0
 
     print()
@@ -207,7 +186,7 @@ if __name__ == '__main__':
 
     chi = grid_characteristic(maze)
     assert chi == 0
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     assert chi == 0
 
     print('Success!')
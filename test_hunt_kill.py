@@ -39,36 +39,7 @@ import mazelib
 from grid import RectangularGrid
 from maze import Maze
 from hunt_kill import HuntAndKill
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import euler_characteristic
 
 if __name__ == '__main__':
     import argparse
@@ -89,7 +60,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     HuntAndKill.on(maze, debug=True, use_frontier=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -103,7 +74,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     HuntAndKill.on(maze, debug=True, use_frontier=False)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -117,7 +88,7 @@ if __name__ == '__main__':
     maze = Maze(grid)
     HuntAndKill.on(maze, debug=True, no_shuffle=True)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k > 1:
         print('There are some isolated cells in the maze.')
     if maze.k == 1 and chi == 0:
@@ -39,36 +39,7 @@ from maze import Maze
 from wilson import Wilson
 from masked_grid import MaskedGrid, make_mask
 from maze_pillow import MazeSketcher
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import euler_characteristic
 
 if __name__ == '__main__':
     import argparse
@@ -106,7 +77,7 @@ if __name__ == '__main__':
     masked_maze = Maze(masked_grid)
     Wilson.on(masked_maze)
     print(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     assert maze.k == 2
 
     print('Test 2)',
@@ -54,36 +54,7 @@ from maze import Maze
 from wilson import Wilson
 from maze_pillow import MazeSketcher
 from distances import BellmanFord
-
-def maze_characteristic(maze, output=True):
-    """determine the Euler characteristic of the maze
-
-    Returns v - e - k.
-
-    BUGS
-
-        Will fail if there are one-way passages.
-    """
-    grid = maze.grid
-    v = len(grid.cells)
-    k = len(maze.components)
-
-    ee = 0
-    for cell in grid.each_cell():
-        passages = set(cell.passages)
-        ee += len(passages)
-        if cell in passages:
-            ee += 1         # loops are counted twice
-     
-    e = ee / 2 if ee % 2 else ee // 2
-    chi = v - e - k
-    if output:
-        print('Maze characteristic:')
-        print('       number of nodes:', '        v =', v)
-        print('       number of edges:', '        e =', e)
-        print('  number of components:', '        k =', k)
-        print('  Euler characteristic:', 'v - e - k =', chi)
-    return chi
+from maze_support import euler_characteristic
 
 if __name__ == '__main__':
     import argparse
@@ -121,7 +92,7 @@ if __name__ == '__main__':
     grid.set_edge_color(cell4, cell2, 'cyan')
     maze = Maze(grid)
     #Wilson.on(maze)
-    #chi = maze_characteristic(maze)
+    #chi = euler_characteristic(maze)
     #if maze.k == 1 and chi == 0:
     #    print('A perfect maze!')
     #else:
@@ -133,7 +104,7 @@ if __name__ == '__main__':
     grid = PolarGrid(rows, poles, cell_ratio=split)
     maze = Maze(grid)
     Wilson.on(maze)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k == 1 and chi == 0:
         print('A perfect maze!')
     else:
@@ -169,7 +140,7 @@ if __name__ == '__main__':
     grid = PolarGrid(rows, poles, cell_ratio=split)
     maze = Maze(grid)
     InWinder.on(maze, p=0.7)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k == 1 and chi == 0:
         print('A perfect maze!')
     else:
@@ -186,7 +157,7 @@ if __name__ == '__main__':
     grid = PolarGrid(rows, poles, cell_ratio=split)
     maze = Maze(grid)
     InWinder.on(maze, p=0.7)
-    chi = maze_characteristic(maze)
+    chi = euler_characteristic(maze)
     if maze.k == 1 and chi == 0:
         print('A perfect maze!')
     else: